@@ -7,16 +7,25 @@ This module Contains functions to get a service of Google Sheets API v4.
 
 import httplib2
 import os
+import re
 
 from apiclient import discovery
+from apiclient.model import JsonModel
 from oauth2client import client, tools
 from oauth2client.file import Storage
 
+try:
+    import orjson
+except ImportError:  # orjson is optional. Without it, the default JsonModel (json module) is used.
+    orjson = None
+
 # If modifying these scopes, delete your previously saved credentials
 # at ~/.credentials/sheets.googleapis.com-python-quickstart.json
 SCOPES = 'https://www.googleapis.com/auth/spreadsheets'
 CLIENT_SECRET_FILE = 'client_secret.json'
 
+HTTP_TIMEOUT = 30  # seconds
+
 
 def get_credentials():
     """Gets valid user credentials from storage.
@@ -42,12 +51,90 @@ def get_credentials():
     return credentials
 
 
-def create_service():
+_NON_ASCII = re.compile('[^\x00-\x7f]')
+
+
+def _escape_non_ascii(match):
+    """Returns JSON escape sequence of the matched non-ASCII character (surrogate pair if not in BMP)."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return '\\u{:04x}'.format(code)
+    code -= 0x10000
+    return '\\u{:04x}\\u{:04x}'.format(0xd800 | (code >> 10), 0xdc00 | (code & 0x3ff))
+
+
+# a run of digits this long may be an int orjson.loads can't keep exact (over 64 bits).
+_LONG_DIGITS = re.compile('[0-9]{19}')
+_LONG_DIGITS_BYTES = re.compile(b'[0-9]{19}')
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel which serializes request bodies and deserializes responses with orjson.
+
+    Serialized bodies are ASCII str, like those of JsonModel (json.dumps with ensure_ascii).
+    Non-ASCII characters are escaped since http.client encodes str body in latin-1,
+    and bytes body would be mangled in a BatchHttpRequest, whose parts go through the email package.
+
+    It falls back to the json module (JsonModel) in the following cases, so the results are the same as JsonModel's.
+    - serializing a body with an int over 64 bits (orjson raises for it)
+    - deserializing a response with a run of 19 or more digits (orjson.loads would turn an int over 64 bits
+      into an inexact float), or one orjson can't parse (ex: NaN)
+
+    One difference remains: float NaN and infinities in a body are serialized as null (which clears the field),
+    while the json module serializes them as NaN and Infinity (which the server rejects).
+    Don't put them in requests.
+    """
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        try:
+            body = orjson.dumps(body_value).decode()
+        except orjson.JSONEncodeError:
+            return super().serialize(body_value)
+        if not body.isascii():
+            # non-ASCII characters appear only in JSON strings, so they can be escaped as they are.
+            body = _NON_ASCII.sub(_escape_non_ascii, body)
+        return body
+
+    def deserialize(self, content):
+        long_digits = _LONG_DIGITS_BYTES if isinstance(content, bytes) else _LONG_DIGITS
+        if long_digits.search(content):
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def create_http(credentials=None, cache_dir=None):
+    """Creates an authorized Http object and returns it.
+    Http object is not thread-safe, so each thread should use its own one.
+    Credentials can be shared, so pass the same credentials when creating Http objects of many threads.
+
+    If cache_dir is given, GET responses (ex: spreadsheets.get) are cached there in plaintext and revalidated
+    with ETag. The cache is not safe for multiple threads, so give cache_dir to the Http object of one thread only.
+
+    credentials: Credentials (obtained by get_credentials() if None)
+    cache_dir: str (path of the directory for caching responses. None for no cache)
+    returns: Http object
+    """
+    if credentials is None:
+        credentials = get_credentials()
+    cache = httplib2.FileCache(cache_dir) if cache_dir is not None else None
+    return credentials.authorize(httplib2.Http(cache=cache, timeout=HTTP_TIMEOUT))
+
+
+def create_service(credentials=None, cache_dir=None):
     """Creates a Sheets API service object and returns it.
 
+    credentials: Credentials (obtained by get_credentials() if None)
+    cache_dir: str (path of the directory for caching responses of the service. None for no cache)
     returns: Sheets API service object
     """
-    credentials = get_credentials()
-    http = credentials.authorize(httplib2.Http())
-    service = discovery.build('sheets', 'v4', http=http)
+    model = OrjsonModel() if orjson is not None else None
+    service = discovery.build('sheets', 'v4', http=create_http(credentials, cache_dir), model=model)
     return service
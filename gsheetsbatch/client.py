@@ -16,38 +16,35 @@ https://developers.google.com/sheets/api/limits
 """
 # Todo: add functions for checking read quota
 
-from .api_service import create_service
+from .api_service import create_http, create_service, get_credentials
+import asyncio
+import logging
+import threading
 import time
-import math
 
-from pprint import pprint
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from functools import wraps
 
 from .models import Spreadsheet
 
+log = logging.getLogger(__name__)
 
-class TimeRequestTable:
-    def __init__(self):
-        self.time_table = []
-        self.end_time = -1
-
-    def register(self, elapsed_time, num_of_executed_requests):
-        # 등록은 천천히 하는 것이 쿼터를 넘지 않는데 이로우므로 올림을 한다.(더 빨리 등록되는 건 문제가 될 수 있다)
-        elapsed_time = int(math.ceil(elapsed_time))
-        if elapsed_time > self.end_time:
-            if self.end_time == -1:
-                last_num_of_executed_requests = 0
-            else:
-                last_num_of_executed_requests = self.time_table[self.end_time]
-            for i in range(self.end_time + 1, elapsed_time):
-                self.time_table.append(last_num_of_executed_requests)
+# (한 project 의 한 user 마다) 100초당 100개의 요청이 Google Sheets API 의 정해진 quota 다.
+WRITE_QUOTA_REQUESTS = 100
+WRITE_QUOTA_SECONDS = 100
 
-            self.time_table.append(num_of_executed_requests)
-            self.end_time = elapsed_time
+# max number of requests sent in the body of one batchUpdate request execution
+BATCH_UPDATE_CHUNK_SIZE = 500
 
-    def get_requests_num_at(self, elapsed_time):
-        # 참조는 앞에 있는 것을 하는 것이 지난 100초 동안 요청 수가 크게 잡히므로 쿼터를 넘지 않는데 이롭다.
-        return self.time_table[int(math.floor(elapsed_time))]
+# max number of spreadsheets whose deposited requests are executed concurrently
+EXECUTE_MAX_WORKERS = 8
+
+# max number of rows and cells of an updateCells request merged from adjacent ones,
+# so that a merged request doesn't get around the size bound of BATCH_UPDATE_CHUNK_SIZE.
+MERGED_UPDATE_CELLS_MAX_ROWS = BATCH_UPDATE_CHUNK_SIZE
+MERGED_UPDATE_CELLS_MAX_CELLS = 10000
 
 
 def under_write_quota(execute_function):
@@ -55,85 +52,373 @@ def under_write_quota(execute_function):
     """
 
     @wraps(execute_function)
-    def wrapper(*args, **kwargs):
-        Client.test_for_write_quota()
-        result = execute_function(*args, **kwargs)
-        Client.num_of_executed_write_requests += 1
-        elapsed_time = time.time() - Client.time_start
-        Client.time_requests_table.register(elapsed_time,
-                                            Client.num_of_executed_write_requests)
-        return result
+    def wrapper(self, *args, **kwargs):
+        self.test_for_write_quota()
+        try:
+            return execute_function(self, *args, **kwargs)
+        finally:
+            self._register_write()
 
     return wrapper
 
 
+def _cell_count(rows):
+    """Returns number of cells in rows (list of RowData json)."""
+    return sum(len(row.get('values', ())) for row in rows)
+
+
+def _update_cells_follows(a, b):
+    """Returns whether updateCells request b updates the same fields as a, starting right below the rows of a."""
+    if a['fields'] != b['fields'] or 'start' not in a or 'start' not in b:
+        return False
+    a_start, b_start = a['start'], b['start']
+    return a_start['sheetId'] == b_start['sheetId'] and a_start['columnIndex'] == b_start['columnIndex'] \
+        and a_start['rowIndex'] + len(a['rows']) == b_start['rowIndex']
+
+
+def _merge_update_cells(a, b):
+    """Returns an updateCells request equivalent to updateCells request a followed by b,
+    or None if b doesn't start right below the rows of a, or the merged request would have more than
+    MERGED_UPDATE_CELLS_MAX_ROWS rows or MERGED_UPDATE_CELLS_MAX_CELLS cells.
+    """
+    if not _update_cells_follows(a, b) or len(a['rows']) + len(b['rows']) > MERGED_UPDATE_CELLS_MAX_ROWS \
+            or _cell_count(a['rows']) + _cell_count(b['rows']) > MERGED_UPDATE_CELLS_MAX_CELLS:
+        return None
+    return {
+        'rows': a['rows'] + b['rows'],
+        'fields': a['fields'],
+        'start': a['start']
+    }
+
+
+def _merge_repeat_cell(a, b):
+    """Returns a repeatCell request equivalent to repeatCell request a followed by b,
+    or None if they don't repeat the same cell over two ranges sharing a whole edge.
+    """
+    if a['fields'] != b['fields'] or a['cell'] != b['cell']:
+        return None
+    a_range, b_range = a['range'], b['range']
+    if a_range['sheetId'] != b_range['sheetId'] or None in a_range.values() or None in b_range.values():
+        return None
+
+    if a_range['startColumnIndex'] == b_range['startColumnIndex'] \
+            and a_range['endColumnIndex'] == b_range['endColumnIndex']:
+        start, end = 'startRowIndex', 'endRowIndex'
+    elif a_range['startRowIndex'] == b_range['startRowIndex'] and a_range['endRowIndex'] == b_range['endRowIndex']:
+        start, end = 'startColumnIndex', 'endColumnIndex'
+    else:
+        return None
+    if a_range[end] == b_range[start]:
+        merged_range = dict(a_range, **{end: b_range[end]})
+    elif b_range[end] == a_range[start]:
+        merged_range = dict(a_range, **{start: b_range[start]})
+    else:
+        return None
+    return {
+        'range': merged_range,
+        'cell': a['cell'],
+        'fields': a['fields']
+    }
+
+
+def _split_fields(fields):
+    """Returns list of field paths in fields (str of comma separated field paths),
+    or None if fields has a wildcard (*) or a sub-selection (parentheses), which are not split into paths.
+    """
+    if '*' in fields or '(' in fields:
+        return None
+    return [path.strip() for path in fields.split(',') if path.strip()]
+
+
+def _merged_json(a, b):
+    """Returns a new json with b merged into a recursively. a and b are not modified."""
+    merged = dict(a)
+    for key, value in b.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merged_json(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _set_path(json, path, value):
+    """Sets value at path (list of keys) of json, creating dicts on the way."""
+    for key in path[:-1]:
+        json = json.setdefault(key, {})
+    json[path[-1]] = value
+
+
+def _masked_json(json, paths):
+    """Returns a new json with only the values of json at paths (list of field paths).
+    Values not in json are left out, as the field mask clears them.
+    """
+    masked = {}
+    for path in paths:
+        keys = path.split('.')
+        value = json
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            _set_path(masked, keys, value)
+    return masked
+
+
+def _merge_repeat_cell_fields(a, b):
+    """Returns a repeatCell request equivalent to repeatCell request a followed by b,
+    or None if they don't repeat over the same range, any field path of one of them
+    is (a part of) a field path of the other, or any of fields can't be split into field paths.
+    """
+    if a['range'] != b['range']:
+        return None
+    a_paths, b_paths = _split_fields(a['fields']), _split_fields(b['fields'])
+    if a_paths is None or b_paths is None:
+        return None
+    for a_path in a_paths:
+        for b_path in b_paths:
+            if a_path == b_path or a_path.startswith(b_path + '.') or b_path.startswith(a_path + '.'):
+                return None
+    # only values in the field masks are kept, since the merged mask covers the values outside one mask.
+    # the masks don't overlap, so the masked jsons are merged without conflict.
+    return {
+        'range': a['range'],
+        'cell': _merged_json(_masked_json(a['cell'], a_paths), _masked_json(b['cell'], b_paths)),
+        'fields': ', '.join(a_paths + b_paths)
+    }
+
+
+def _merge_requests(a, b):
+    """Returns a request equivalent to request a followed by request b, or None if they can't be merged into one.
+    a and b are not modified.
+
+    Merged are updateCells requests writing contiguous rows, repeatCell requests repeating the same cell
+    over contiguous ranges, and repeatCell requests updating different fields of the same range.
+    """
+    if 'updateCells' in a and 'updateCells' in b:
+        merged = _merge_update_cells(a['updateCells'], b['updateCells'])
+        return None if merged is None else {'updateCells': merged}
+    if 'repeatCell' in a and 'repeatCell' in b:
+        merged = _merge_repeat_cell(a['repeatCell'], b['repeatCell'])
+        if merged is None:
+            merged = _merge_repeat_cell_fields(a['repeatCell'], b['repeatCell'])
+        return None if merged is None else {'repeatCell': merged}
+    return None
+
+
+def _raise_first_error(errors):
+    """Raises the first of errors (exceptions, or None for success) after logging the others,
+    which would be lost otherwise.
+    """
+    errors = [error for error in errors if error is not None]
+    if not errors:
+        return
+    for error in errors[1:]:
+        log.error("executing deposited requests failed as well: %r", error, exc_info=error)
+    raise errors[0]
+
+
 class RequestsContainer:
     """Container for batchUpdate requests_container."""
 
     def __init__(self):
-        self.d = {}
+        self.d = defaultdict(deque)
+        # protectedRangeIds of deposited deleteProtectedRange requests of each spreadsheet
+        self._deleted_protected_range_ids = defaultdict(set)
+        # [updateCells request made by merging in this container, its number of cells] of each spreadsheet.
+        # Since no one else refers to the request, later requests are merged into it in place.
+        self._merged_update_cells = {}
 
     def deposit(self, spreadsheet_id, request):
-        if spreadsheet_id not in self.d:
-            self.d[spreadsheet_id] = []
-        self.d[spreadsheet_id].append(request)
+        if 'deleteProtectedRange' in request:
+            # deleting the same protected range again would make the whole batchUpdate request fail.
+            deleted_ids = self._deleted_protected_range_ids[spreadsheet_id]
+            protected_range_id = request['deleteProtectedRange']['protectedRangeId']
+            if protected_range_id in deleted_ids:
+                return
+            deleted_ids.add(protected_range_id)
+
+        requests = self.d[spreadsheet_id]
+        # a request which can be merged into the last one replaces it, so that fewer requests are sent.
+        if requests:
+            last = requests[-1]
+            merged_update_cells = self._merged_update_cells.get(spreadsheet_id)
+            if merged_update_cells is not None and merged_update_cells[0] is last:
+                if 'updateCells' in request and self._extend_merged_update_cells(merged_update_cells,
+                                                                                 request['updateCells']):
+                    return
+            else:
+                merged = _merge_requests(last, request)
+                if merged is not None:
+                    requests[-1] = merged
+                    if 'updateCells' in merged:
+                        self._merged_update_cells[spreadsheet_id] = [merged,
+                                                                     _cell_count(merged['updateCells']['rows'])]
+                    return
+        requests.append(request)
+
+    @staticmethod
+    def _extend_merged_update_cells(merged_update_cells, update_cells):
+        """Appends rows of update_cells (updateCells request) to the merged updateCells request in place,
+        without copying the rows merged so far. Returns False if they can't be merged (see _merge_update_cells).
+
+        :param merged_update_cells: [updateCells request made by merging in the container, its number of cells]
+        :param update_cells: updateCells request
+        :returns: bool
+        """
+        merged, cell_count = merged_update_cells
+        merged = merged['updateCells']
+        rows = update_cells['rows']
+        cell_count += _cell_count(rows)
+        if not _update_cells_follows(merged, update_cells) \
+                or len(merged['rows']) + len(rows) > MERGED_UPDATE_CELLS_MAX_ROWS \
+                or cell_count > MERGED_UPDATE_CELLS_MAX_CELLS:
+            return False
+        merged['rows'].extend(rows)
+        merged_update_cells[1] = cell_count
+        return True
+
+    def drain(self, spreadsheet_id, n):
+        """Removes at most n oldest deposited requests of the spreadsheet and returns them.
+
+        :param spreadsheet_id: str
+        :param n: int
+        :returns: list of requests (empty if nothing is deposited)
+        """
+        # get instead of indexing, since looking up a missing key of defaultdict would insert an empty deque
+        requests = self.d.get(spreadsheet_id)
+        if not requests:
+            return []
+        popleft = requests.popleft
+        drained = [popleft() for _ in range(min(n, len(requests)))]
+        if not requests:
+            del self.d[spreadsheet_id]
+            self._deleted_protected_range_ids.pop(spreadsheet_id, None)
+            self._merged_update_cells.pop(spreadsheet_id, None)
+        return drained
+
+    def restore(self, spreadsheet_id, requests):
+        """Puts requests drained from the spreadsheet back in front of its deposited requests, in the same order.
+        Used when executing drained requests failed, so that they are executed first next time.
+
+        :param spreadsheet_id: str
+        :param requests: list of requests returned by drain
+        :returns: None
+        """
+        self.d[spreadsheet_id].extendleft(reversed(requests))
+        deleted_ids = self._deleted_protected_range_ids[spreadsheet_id]
+        for request in requests:
+            if 'deleteProtectedRange' in request:
+                deleted_ids.add(request['deleteProtectedRange']['protectedRangeId'])
 
 
 class Client:
     """An instance of this class communicates with Google Sheets API.
 
     """
-    # Todo: To include class variables below to instance variables.
-    service = create_service()
-    time_start = time.time()
-    num_of_executed_write_requests = 0
-    time_requests_table = TimeRequestTable()
-
-    def __init__(self, google_account_email=None):
+    def __init__(self, google_account_email=None, cache_dir=None):
         """If sheet protection request is to be used, set google_account_email.
+        If cache_dir is set, GET responses of the service (ex: open_by_id) are cached in the directory
+        (in plaintext, so don't use it for private spreadsheets on shared machines) and revalidated with ETag.
 
         google_account_email: str (ex: 'example@gmail.com')
+        cache_dir: str (ex: '.httpcache')
         spreadsheet_id: Spreadsheet ID
         """
         self.google_account_email = google_account_email
+        self._cache_dir = cache_dir
         self.requests_container = RequestsContainer()  # for batchUpdate requests containing
+        self._credentials = None
+        self._service = None
+        self._local = threading.local()  # Http object of each thread executing batchUpdate requests
+        self._executor = None
+
+        # execution times of the last WRITE_QUOTA_REQUESTS write requests (oldest first)
+        self._write_times = deque(maxlen=WRITE_QUOTA_REQUESTS)
+        self._writes_in_flight = 0
+        self._write_quota_condition = threading.Condition()
+
+    @property
+    def service(self):
+        """Sheets API service object. It is created on first use."""
+        self._ensure_service()
+        return self._service
+
+    def _ensure_service(self):
+        """Creates service (and credentials) if not created yet.
+        Call it before executing requests in worker threads, so that they don't race to create them.
+        """
+        if self._service is None:
+            self._service = create_service(self.credentials, self._cache_dir)
 
-    @staticmethod
-    def test_for_write_quota():
+    @property
+    def credentials(self):
+        """Credentials shared by Http objects of all threads. They are obtained on first use."""
+        if self._credentials is None:
+            self._credentials = get_credentials()
+        return self._credentials
+
+    def test_for_write_quota(self):
         """Test for whether below (write) quota limit. If it's not, sleep for proper time.
         (According to Usage Limits web page of google (https://developers.google.com/sheets/api/limits)
         "Limits for reads and writes are tracked separately.")
 
-        returns: bool : time_start_reset flag (if this is True, should reset cls.time_start after response)
+        Only the last WRITE_QUOTA_REQUESTS execution times are kept. Writes still in flight
+        (in other threads) count as executed now. If the window would be over quota, sleep until
+        enough of the oldest executions leave it. Then this write is counted as in flight,
+        so that concurrent callers can't go over quota together.
+
+        returns: None
         """
-        elapsed_time = time.time() - Client.time_start
-        future_executed_requests_num = Client.num_of_executed_write_requests + 1
-        # (한 project 의 한 user 마다) 100초당 100개의 요청이 Google Sheets API 의 정해진 quota 다.
-        if elapsed_time < 100:
-            request_per_second = future_executed_requests_num / elapsed_time
-            print("If I execute this requests now, during past {} seconds I execute {} requests. requests/seconds: {}".
-                  format(elapsed_time, future_executed_requests_num, request_per_second))
-            if future_executed_requests_num > 100:
-                print("whoa.... too fast.")
-                sleep_time = 100 - elapsed_time
-                print("I'll take a nap for {} seconds...".format(sleep_time))
-                time.sleep(sleep_time)
-        else:
-            requests_num_last_100s = future_executed_requests_num \
-                                     - Client.time_requests_table.get_requests_num_at(elapsed_time - 100)
-            print("If I execute this requests now, during past {} seconds I execute {} requests. requests/seconds: {}".
-                  format(100, requests_num_last_100s, requests_num_last_100s / 100))
-            if requests_num_last_100s > 100:
-                print("whoa.... too fast. It's no good if request execution number during past 100 seconds"
-                      "is over 100...")
-                for i in range(0, 101):
-                    temp = future_executed_requests_num \
-                           - Client.time_requests_table.get_requests_num_at(elapsed_time - 100 + i)
-                    if temp < 100:
-                        break
-                sleep_time = i
-                print("I'll take a nap for {} seconds...".format(sleep_time))
-                time.sleep(sleep_time)
+        condition = self._write_quota_condition
+        with condition:
+            write_times = self._write_times
+            while True:
+                # the oldest (excess + 1) executions should have left the window.
+                excess = len(write_times) + self._writes_in_flight - WRITE_QUOTA_REQUESTS
+                if excess < 0:
+                    break
+                if excess >= len(write_times):
+                    # too many writes in flight. wait for one of them to be registered.
+                    condition.wait()
+                    continue
+                # fast path without reading the clock: they had already left it when the latest one was registered.
+                if write_times[-1] - write_times[excess] >= WRITE_QUOTA_SECONDS:
+                    break
+                sleep_time = write_times[excess] + WRITE_QUOTA_SECONDS - time.monotonic()
+                if sleep_time <= 0:
+                    break
+                log.info("whoa.... too fast. It's no good if request execution number during past %s seconds "
+                         "is over %s. I'll take a nap for %s seconds...",
+                         WRITE_QUOTA_SECONDS, WRITE_QUOTA_REQUESTS, sleep_time)
+                # waiting releases the lock, so writes in flight can be registered meanwhile.
+                condition.wait(sleep_time)
+            self._writes_in_flight += 1
+
+    def _register_write(self):
+        """Registers the end of a write request counted as in flight by test_for_write_quota.
+        Its execution time is taken after the response (or failure), not before the request,
+        because registering later is what keeps us from going over quota.
+        """
+        with self._write_quota_condition:
+            self._writes_in_flight -= 1
+            self._write_times.append(time.monotonic())
+            self._write_quota_condition.notify_all()
+
+    def _http(self):
+        """Returns Http object of the current thread."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = create_http(self.credentials)
+        return http
+
+    def _get_executor(self):
+        """Returns ThreadPoolExecutor executing deposited requests of different spreadsheets concurrently.
+        It is created on first use.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=EXECUTE_MAX_WORKERS)
+        return self._executor
 
     @under_write_quota
     def create_spreadsheet(self, title):
@@ -149,9 +434,7 @@ class Client:
         }
         request = self.service.spreadsheets().create(body=spreadsheet_body)
         response = request.execute()
-
-        pprint(response)
-        print()
+        log.debug("response: %r", response)
 
         spreadsheet_json = response
         return Spreadsheet(self, spreadsheet_json)
@@ -166,32 +449,110 @@ class Client:
         spreadsheet_json = request.execute()
         return Spreadsheet(self, spreadsheet_json)
 
+    @contextmanager
+    def batch_http(self, callback=None):
+        """Context manager yielding a BatchHttpRequest of the service.
+        Requests added to it are executed in one HTTP request when the with block ends.
+        Use it for unrelated read requests (ex: spreadsheets().get(...) of several spreadsheets).
+        Write requests should be deposited instead, since the batch is not checked for write quota.
+
+        with client.batch_http(callback) as batch:
+            batch.add(client.service.spreadsheets().get(spreadsheetId=spreadsheet_id))
+
+        :param callback: function(request_id, response, exception) called for each added request
+        :returns: BatchHttpRequest object
+        """
+        batch = self.service.new_batch_http_request(callback=callback)
+        yield batch
+        batch.execute()
+
     def execute_all_deposited_requests(self):
         """Executes all deposited (batchUpdate) requests in self.requests_container.
+        If executions of some spreadsheets fail, the first exception is raised after all executions end,
+        and the others are logged.
 
         :returns: None
         """
-        # if doesn't change to list, following for loop erase RuntimeError which says
-        # "RuntimeError: dictionary changed size during iteration"
-        for spreadsheet_id in list(self.requests_container.d.keys()):
-            self.execute_deposited_requests_of_the_spreadsheet(spreadsheet_id)
+        spreadsheet_ids = list(self.requests_container.d)
+        if len(spreadsheet_ids) <= 1:
+            for spreadsheet_id in spreadsheet_ids:
+                self.execute_deposited_requests_of_the_spreadsheet(spreadsheet_id)
+            return
+
+        # requests of different spreadsheets are independent, so execute them concurrently.
+        self._ensure_service()
+        executor = self._get_executor()
+        futures = []
+        for spreadsheet_id in spreadsheet_ids:
+            futures.append(executor.submit(self.execute_deposited_requests_of_the_spreadsheet, spreadsheet_id))
+        # wait for all of them even if one fails, so that no worker thread is still draining the container
+        # when this returns (ex: a caller retrying right away would drain the same spreadsheet concurrently).
+        wait(futures)
+        _raise_first_error([future.exception() for future in futures])
+
+    async def execute_all_deposited_requests_async(self):
+        """Coroutine version of execute_all_deposited_requests for asyncio applications.
+        batchUpdate requests are executed in the thread pool, so the event loop is not blocked meanwhile.
+        Like execute_all_deposited_requests, it ends (even if cancelled) only after all executions end.
+        Then the first exception is raised, and the others are logged.
+
+        :returns: None
+        """
+        spreadsheet_ids = list(self.requests_container.d)
+        if not spreadsheet_ids:
+            return
+        self._ensure_service()
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        executions = asyncio.gather(*(loop.run_in_executor(executor,
+                                                           self.execute_deposited_requests_of_the_spreadsheet,
+                                                           spreadsheet_id)
+                                      for spreadsheet_id in spreadsheet_ids),
+                                    return_exceptions=True)
+        try:
+            # shielded, since cancelling can't stop executions in the worker threads.
+            errors = await asyncio.shield(executions)
+        except asyncio.CancelledError:
+            # even if cancelled, don't return while worker threads are still draining the container.
+            await executions
+            raise
+        _raise_first_error(errors)
 
-    @under_write_quota
     def execute_deposited_requests_of_the_spreadsheet(self, spreadsheet_id):
         """Executes deposited requests of the spreadsheet whose spreadsheet id is spreadsheet_id.
+        Requests are drained in chunks of BATCH_UPDATE_CHUNK_SIZE, one batchUpdate request execution per chunk.
+        If an execution fails, its chunk is put back in front of the requests not yet executed and the exception
+        is raised. So the next execution starts from the failed chunk, keeping the deposited order.
+        (A batchUpdate request is applied all or nothing, so a chunk which failed is not applied in part.)
+
+        :param spreadsheet_id: str
+        :returns: None
+        """
+        requests_container = self.requests_container
+        while True:
+            requests = requests_container.drain(spreadsheet_id, BATCH_UPDATE_CHUNK_SIZE)
+            if not requests:
+                break
+            try:
+                self._send_batch(spreadsheet_id, requests)
+            except Exception:
+                requests_container.restore(spreadsheet_id, requests)
+                raise
+
+    @under_write_quota
+    def _send_batch(self, spreadsheet_id, requests):
+        """Executes one batchUpdate request whose body contains requests.
 
         :param spreadsheet_id: str
+        :param requests: list of requests
         :returns: None
         """
-        assert spreadsheet_id in self.requests_container.d, "No requests deposited for spreadsheet " + spreadsheet_id
-        requests = self.requests_container.d.pop(spreadsheet_id)
         requests_body = {
             'requests': requests
         }
         response = self.service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id,
-                                                           body=requests_body).execute()
-        pprint(response)
-        print()
+                                                           body=requests_body).execute(http=self._http())
+        log.debug("response: %r", response)
 
 
 if __name__ == '__main__':
@@ -6,32 +6,82 @@ This module contains Spreadsheet, Sheet class.
 
 """
 
+import re
+
+from functools import lru_cache
+
+# allowed values of arguments of RequestDepositor methods
+_DIMENSIONS = frozenset({'COLUMNS', 'ROWS'})
+_BORDER_SIDES = frozenset({'top', 'bottom', 'left', 'right', 'innerHorizontal', 'innerVertical'})
+_BORDER_STYLES = frozenset({'DOTTED', 'DASHED', 'SOLID', 'SOLID_MEDIUM', 'SOLID_THICK', 'NONE', 'DOUBLE'})
+_HORIZONTAL_ALIGNMENTS = frozenset({'LEFT', 'CENTER', 'RIGHT'})
+_VERTICAL_ALIGNMENTS = frozenset({'TOP', 'MIDDLE', 'BOTTOM'})
+_VALUE_TYPES = frozenset({'numberValue', 'stringValue', 'boolValue', 'formulaValue', 'errorValue'})
+_CELL_SIDES = frozenset({'top', 'bottom', 'left', 'right'})
+_TEXT_FORMAT_KEYS = frozenset({'foregroundColor', 'fontFamily', 'fontSize', 'bold', 'italic', 'strikethrough',
+                               'underline'})
+_MERGE_TYPES = frozenset({'MERGE_ALL', 'MERGE_COLUMNS', 'MERGE_ROWS'})
+_CONDITIONAL_FORMAT_TYPES = frozenset({'booleanRule', 'gradientRule'})
+_NUMBER_FORMAT_TYPES = frozenset({'AUTOMATIC', 'TEXT', 'NUMBER', 'PERCENT', 'CURRENCY', 'DATE', 'TIME', 'DATE_TIME',
+                                  'SCIENTIFIC'})
+
+
+def _validate(name, value, allowed):
+    """Raises ValueError if value is not in allowed (a frozenset of allowed values of the argument name)."""
+    if value not in allowed:
+        raise ValueError("{} must be one of {}, but {!r}.".format(name, ', '.join(repr(x) for x in sorted(allowed)),
+                                                                 value))
+
+
+def _border_object(style, color):
+    """Validates style and returns Border json (style, and color if given)."""
+    _validate('style', style, _BORDER_STYLES)
+    border_object = {'style': style}
+    if color is not None:
+        border_object['color'] = color
+    return border_object
+
+
+def _check_index(name, value):
+    """Raises ValueError if value (one-based index of the argument name) is less than 1. None (unbound) is allowed.
+    The server would reject the whole batchUpdate request with a negative index.
+    """
+    if value is not None and value < 1:
+        raise ValueError("{} must be 1 or more, but {!r}.".format(name, value))
+
+
+def _check_index_range(min_name, min_value, max_name, max_value):
+    """Raises ValueError if min_value is less than 1, or max_value is less than min_value (empty range).
+    None (unbound) is allowed.
+    """
+    _check_index(min_name, min_value)
+    if min_value is not None and max_value is not None and max_value < min_value:
+        raise ValueError("{} must be {} or more, but {!r} < {!r}.".format(max_name, min_name, max_value, min_value))
+
 
+@lru_cache(maxsize=4096)
 def grid_range(sheet_id, min_row, min_col, max_row, max_col):
     """Returns GridRange json.
 
     min_row, min_col, max_row, max_col: int (None if unbound)
 
-    :returns: GridRange json
-    """
-    if min_row is None:
-        start_row_index = None
-    else:
-        start_row_index = min_row - 1
+    Raises ValueError if min_row or min_col is less than 1, or the range is empty,
+    since the server would reject the whole batchUpdate request anyway.
 
-    if min_col is None:
-        start_column_index = None
-    else:
-        start_column_index = min_col - 1
+    Results are cached, so the same GridRange json is shared by requests on the same range.
+    Do not modify it.
 
-    grid_range_json = {
+    :returns: GridRange json
+    """
+    _check_index_range('min_row', min_row, 'max_row', max_row)
+    _check_index_range('min_col', min_col, 'max_col', max_col)
+    return {
         'sheetId': sheet_id,
-        'startRowIndex': start_row_index,
+        'startRowIndex': None if min_row is None else min_row - 1,
         'endRowIndex': max_row,
-        'startColumnIndex': start_column_index,
+        'startColumnIndex': None if min_col is None else min_col - 1,
         'endColumnIndex': max_col
     }
-    return grid_range_json
 
 
 class Spreadsheet:
@@ -39,6 +89,8 @@ class Spreadsheet:
 
     :param json: JSON representation that represents a spreadsheet
     """
+    __slots__ = ('client', 'spreadsheet_id', 'json', 'read_cache', 'deposit_request')
+
     def __init__(self, client, json):
         self.client = client
         self.spreadsheet_id = json['spreadsheetId']
@@ -47,8 +99,15 @@ class Spreadsheet:
         self.deposit_request = Spreadsheet.RequestDepositor(self)
 
     class JSONCacheReader:
+        __slots__ = ('_spreadsheet', '_sheets', '_by_id', '_by_title')
+
         def __init__(self, spreadsheet):
             self._spreadsheet = spreadsheet
+            # Sheet objects of cached sheet jsons, in order and indexed by sheet id and by title.
+            # They are built on first use and reset by refresh_cache
+            self._sheets = None
+            self._by_id = None
+            self._by_title = None
 
         @property
         def title(self):
@@ -59,14 +118,24 @@ class Spreadsheet:
             request = self._spreadsheet.client.service.spreadsheets().\
                 get(spreadsheetId=self._spreadsheet.spreadsheet_id, includeGridData=True)
             self._spreadsheet.json = request.execute()
+            self._sheets = None
+            self._by_id = None
+            self._by_title = None
+
+        def _ensure_indexes(self):
+            if self._sheets is None:
+                self._sheets = [Sheet(self._spreadsheet, sheet_json) for sheet_json in self._spreadsheet.json['sheets']]
+                self._by_id = {sheet.sheet_id: sheet for sheet in self._sheets}
+                self._by_title = {sheet.read_cache.title: sheet for sheet in self._sheets}
 
         def get_sheets(self):
             """Returns a list of Sheet objects of this Spreadsheet object.
+            Until refresh_cache, the same Sheet object is returned for the same sheet.
 
             :returns: list of Sheet objects
             """
-            sheets_json = self._spreadsheet.json['sheets']
-            return [Sheet(self._spreadsheet, sheet_json) for sheet_json in sheets_json]
+            self._ensure_indexes()
+            return list(self._sheets)
 
         def get_sheet_by_id(self, sheet_id):
             """Returns a Sheet object whose sheet id is sheet_id.
@@ -74,13 +143,13 @@ class Spreadsheet:
             :param sheet_id: int
             :returns: Sheet object
             """
-            sheets_json = self._spreadsheet.json['sheets']
-            for sheet_json in sheets_json:
-                if sheet_json['properties']['sheetId'] == sheet_id:
-                    return Sheet(self._spreadsheet, sheet_json)
-            raise AssertionError("Couldn't find corresponding cached sheet json"
-                                 "whose sheetId is " + sheet_id + ". "
-                                 "Please consider to do refresh_cache before")
+            self._ensure_indexes()
+            try:
+                return self._by_id[sheet_id]
+            except KeyError:
+                raise AssertionError("Couldn't find corresponding cached sheet json "
+                                     "whose sheetId is {}. "
+                                     "Please consider to do refresh_cache before".format(sheet_id))
 
         def get_sheet_by_index(self, index):
             """Returns a Sheet object whose index is index.
@@ -88,8 +157,8 @@ class Spreadsheet:
             :param index: int
             :returns: Sheet object
             """
-            sheets_json = self._spreadsheet.json['sheets']
-            return Sheet(self._spreadsheet, sheets_json[index])
+            self._ensure_indexes()
+            return self._sheets[index]
 
         def get_sheet_by_title(self, title):
             """Returns a Sheet object whose title is title.
@@ -97,17 +166,22 @@ class Spreadsheet:
             :param title: str
             :returns: Sheet object
             """
-            sheets_json = self._spreadsheet.json['sheets']
-            for sheet_json in sheets_json:
-                if sheet_json['properties']['title'] == title:
-                    return Sheet(self._spreadsheet, sheet_json)
-            raise AssertionError("Couldn't find corresponding cached sheet json"
-                                 "whose sheet title is" + title + ". "
-                                 "Please consider to do refresh_cache before")
+            self._ensure_indexes()
+            try:
+                return self._by_title[title]
+            except KeyError:
+                raise AssertionError("Couldn't find corresponding cached sheet json "
+                                     "whose sheet title is {}. "
+                                     "Please consider to do refresh_cache before".format(title))
 
     class RequestDepositor:
+        __slots__ = ('_spreadsheet', '_deposit', '_spreadsheet_id', 'sheet_ids_requested_to_add')
+
         def __init__(self, spreadsheet):
             self._spreadsheet = spreadsheet
+            # bound once, since client and spreadsheet of a depositor don't change
+            self._deposit = spreadsheet.client.requests_container.deposit
+            self._spreadsheet_id = spreadsheet.spreadsheet_id
             self.sheet_ids_requested_to_add = []
 
         def update_spreadsheet_title(self, title):
@@ -123,7 +197,7 @@ class Spreadsheet:
                     'fields': 'title'
                 }
             }
-            self._spreadsheet.client.requests_container.deposit(self._spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def add_new_sheet(self):
             """Deposit a request to add a new sheet.
@@ -134,8 +208,9 @@ class Spreadsheet:
             until deposited requests executed and cache is refreshed.)
             """
             new_sheet_id = self.sheet_ids_requested_to_add[-1] + 1 if self.sheet_ids_requested_to_add else 0
-            sheets_json = self._spreadsheet.json['sheets']
-            sheet_ids = [sheet_json['properties']['sheetId'] for sheet_json in sheets_json]
+            read_cache = self._spreadsheet.read_cache
+            read_cache._ensure_indexes()
+            sheet_ids = read_cache._by_id  # dict keyed by sheet ids of cached sheets, for O(1) membership test
             while new_sheet_id in sheet_ids:  # sheet_ids 에 없는 제일 작은 0 이상의 정수로 new_sheet_id 를 고른다.
                 new_sheet_id += 1
 
@@ -146,7 +221,7 @@ class Spreadsheet:
                     }
                 }
             }
-            self._spreadsheet.client.requests_container.deposit(self._spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
             self.sheet_ids_requested_to_add.append(new_sheet_id)
             new_sheet_json = {
                 'properties': {
@@ -162,6 +237,8 @@ class Sheet:
     :param spreadsheet: Spreadsheet Object including this sheet.
     :param json: JSON representation that represents a single sheet
     """
+    __slots__ = ('client', 'parent_spreadsheet', 'sheet_id', 'json', 'read_cache', 'deposit_request')
+
     def __init__(self, spreadsheet, json):
         self.client = spreadsheet.client
         self.parent_spreadsheet = spreadsheet
@@ -171,8 +248,12 @@ class Sheet:
         self.deposit_request = Sheet.RequestDepositor(self)
 
     class JSONCacheReader:
+        __slots__ = ('_sheet', '_properties', '_merged_ranges')
+
         def __init__(self, sheet):
             self._sheet = sheet
+            self._properties = sheet.json['properties']  # SheetProperties json. It is rebound by refresh_cache
+            self._merged_ranges = None  # cached merged_ranges. It is reset by refresh_cache
 
         def refresh_cache(self):
             get_spreadsheet_by_data_filter_request_body = {
@@ -188,34 +269,42 @@ class Sheet:
                                 body=get_spreadsheet_by_data_filter_request_body)
             spreadsheet_json = request.execute()
             self._sheet.json = spreadsheet_json["sheets"][0]
+            self._properties = self._sheet.json['properties']
+            self._merged_ranges = None
+
+        def _rows_data(self):
+            """Returns RowData jsons of the cached json.
+            If the cached json has no grid data (ex: a sheet just created), returns empty tuple.
+            """
+            data = self._sheet.json.get('data')
+            if not data:
+                return ()
+            return data[0].get('rowData', ())
+
+        def _cell_data(self, row, col):
+            """Returns CellData json of the cell (row, col).
+            If the cell is not in cached json (ex: trailing empty cells), returns empty dict.
+            """
+            rows_data = self._rows_data()
+            if not 0 < row <= len(rows_data):
+                return {}
+            values = rows_data[row - 1].get('values', ())
+            if not 0 < col <= len(values):
+                return {}
+            return values[col - 1]
 
         def value_of_cell(self, row, col):
             """Returns user entered value of the cell (row, col).
             For cell with formulas, returned type is str.
             """
-            try:
-                d = self._sheet.json['data'][0]['rowData'][row-1]['values'][col-1]['userEnteredValue']
-            except (KeyError, IndexError):
-                d = {}
-
-            value = None
-            for key in d:
-                value = d[key]
-            return value
+            # ExtendedValue json has only one key, whose name is the type of the value.
+            return next(iter(self._cell_data(row, col).get('userEnteredValue', {}).values()), None)
 
         def effective_value_of_cell(self, row, col):
             """Returns effective value of the cell (row, col).
             For cells with formulas, effective value is the calculated value.
             """
-            try:
-                d = self._sheet.json['data'][0]['rowData'][row-1]['values'][col-1]['effectiveValue']
-            except (KeyError, IndexError):
-                d = {}
-
-            value = None
-            for key in d:
-                value = d[key]
-            return value
+            return next(iter(self._cell_data(row, col).get('effectiveValue', {}).values()), None)
 
         def display_value_of_cell(self, row, col):
             """Returns display value of the cell (row, col).
@@ -223,37 +312,45 @@ class Sheet:
 
             :returns str
             """
-            try:
-                display_value = self._sheet.json['data'][0]['rowData'][row - 1]['values'][col - 1]['formattedValue']
-            except (KeyError, IndexError):
-                display_value = ''
+            return self._cell_data(row, col).get('formattedValue', '')
 
-            return display_value
+        def get_display_grid(self):
+            """Returns display values of all cells as a list of lists, read in a single pass.
+            grid[row-1][col-1] is the same as display_value_of_cell(row, col).
+
+            :returns list of lists of str (row_count lists of column_count str)
+            """
+            column_count = self.column_count
+            grid = [[''] * column_count for _ in range(self.row_count)]
+            for grid_row, row_data in zip(grid, self._rows_data()):
+                for col, cell_data in enumerate(row_data.get('values', ())):
+                    grid_row[col] = cell_data.get('formattedValue', '')
+            return grid
 
         @property
         def title(self):
             """Title of this sheet (str)."""
-            return self._sheet.json['properties']['title']
+            return self._properties['title']
 
         @property
         def index(self):
             """Zero-based index of this sheet (int)."""
-            return self._sheet.json['properties']['index']
+            return self._properties['index']
 
         @property
         def row_count(self):
             """Number of rows (int)."""
-            return self._sheet.json['properties']['gridProperties']['rowCount']
+            return self._properties['gridProperties']['rowCount']
 
         @property
         def column_count(self):
             """Number of columns (int)."""
-            return self._sheet.json['properties']['gridProperties']['columnCount']
+            return self._properties['gridProperties']['columnCount']
 
         @property
         def is_hidden(self):
             """Is hidden sheet? (boolean)"""
-            return self._sheet.json['properties']['hidden']
+            return self._properties['hidden']
 
         @property
         def merged_ranges(self):
@@ -262,12 +359,15 @@ class Sheet:
 
             returns: list of 4-tuple of int (min_row, min_col, max_row, max_col)
             """
-            merges = []
-            sheet = self._sheet.json
-            for merge in sheet.get('merges'):
-                merges.append((merge['startRowIndex'] + 1, merge['startColumnIndex'] + 1,
-                               merge['endRowIndex'], merge['endColumnIndex']))
-            return merges
+            return list(self._cached_merged_ranges())
+
+        def _cached_merged_ranges(self):
+            """Returns tuple of merged ranges, computed once until refresh_cache."""
+            if self._merged_ranges is None:
+                self._merged_ranges = tuple((merge['startRowIndex'] + 1, merge['startColumnIndex'] + 1,
+                                             merge['endRowIndex'], merge['endColumnIndex'])
+                                            for merge in self._sheet.json.get('merges', ()))
+            return self._merged_ranges
 
         def merged_range_of_cell(self, row, col):
             """Returns 4-tuple that represents merged range of the cell.
@@ -278,8 +378,7 @@ class Sheet:
             returns: 4-tuple of int (min_row, min_col, max_row, max_col).
             """
             merge = (row, col, row, col)
-            merges = self.merged_ranges
-            for _merge in merges:
+            for _merge in self._cached_merged_ranges():
                 min_row, min_col, max_row, max_col = _merge
                 if min_row <= row <= max_row and min_col <= col <= max_col:
                     merge = _merge
@@ -315,22 +414,39 @@ class Sheet:
 
             returns: data validation rule json or None
             """
-            sheet = self._sheet.json
-            data_validation_rule = sheet['data'][0]['rowData'][row - 1]['values'][col - 1].get('dataValidation')
-            return data_validation_rule
+            return self._cell_data(row, col).get('dataValidation')
 
         def cells_including_text(self, s):
-            """Returns list of tuples of positions of cells contain str s.
+            """Returns list of tuples of positions of cells whose display values contain str s.
 
             s: str
-            ws: Worksheet object
 
             returns: list
             """
             t = []
-            for row in range(1, self.row_count + 1):
-                for col in range(1, self.column_count + 1):
-                    if s in self.display_value_of_cell(row, col):
+            # rowData and values omit trailing empty rows and cells, so they are skipped as well.
+            for row, row_data in enumerate(self._rows_data(), 1):
+                for col, cell_data in enumerate(row_data.get('values', ()), 1):
+                    if s in cell_data.get('formattedValue', ''):
+                        t.append((row, col))
+            return t
+
+        def cells_including_any(self, strs):
+            """Returns list of tuples of positions of cells whose display values contain any of strs.
+            Cells are scanned once, with one compiled pattern matching all of strs.
+
+            strs: iterable of str
+
+            returns: list
+            """
+            t = []
+            strs = list(strs)
+            if not strs:
+                return t
+            search = re.compile('|'.join(re.escape(s) for s in strs)).search
+            for row, row_data in enumerate(self._rows_data(), 1):
+                for col, cell_data in enumerate(row_data.get('values', ()), 1):
+                    if search(cell_data.get('formattedValue', '')):
                         t.append((row, col))
             return t
 
@@ -341,19 +457,18 @@ class Sheet:
 
             :return: str (one of None, 'DOTTED', 'DASHED', 'SOLID', 'SOLID_MEDIUM', 'SOLID_THICK', 'DOUBLE')
             """
-            if side not in ('top', 'bottom', 'left', 'right'):
-                raise ValueError("side should be one of 'top', 'bottom', 'left', 'right', but '{}'.".format(side))
-            sheet = self._sheet.json
-            try:
-                border_style = sheet['data'][0]['rowData'][row - 1]['values'][col - 1] \
-                ['effectiveFormat']['borders'][side]['style']
-            except KeyError:
-                border_style = None
-            return border_style
+            _validate('side', side, _CELL_SIDES)
+            borders = self._cell_data(row, col).get('effectiveFormat', {}).get('borders', {})
+            return borders.get(side, {}).get('style')
 
     class RequestDepositor:
+        __slots__ = ('_sheet', '_deposit', '_spreadsheet_id')
+
         def __init__(self, sheet):
             self._sheet = sheet
+            # bound once, since client and parent spreadsheet of a depositor don't change
+            self._deposit = sheet.client.requests_container.deposit
+            self._spreadsheet_id = sheet.parent_spreadsheet.spreadsheet_id
 
         def insert_row_or_column(self, dimension, start_index, end_index, inherit_from_before=True):
             """Deposit a request to insert rows or columns.
@@ -365,8 +480,8 @@ class Sheet:
 
             :returns: None
             """
-            if dimension != 'COLUMNS' and dimension != 'ROWS':
-                raise ValueError("dimension must be 'COLUMNS'or 'ROWS'.")
+            _validate('dimension', dimension, _DIMENSIONS)
+            _check_index_range('start_index', start_index, 'end_index', end_index)
             request = {
                 'insertDimension': {
                     'range': {
@@ -378,7 +493,7 @@ class Sheet:
                     'inheritFromBefore': inherit_from_before
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def size_row_or_column(self, dimension, start_index, end_index, pixel_size):
             """Deposit a request to fix a column width or row height.
@@ -390,8 +505,8 @@ class Sheet:
 
             :returns: None
             """
-            if dimension != 'COLUMNS' and dimension != 'ROWS':
-                raise ValueError("dimension must be 'COLUMNS'or 'ROWS'.")
+            _validate('dimension', dimension, _DIMENSIONS)
+            _check_index_range('start_index', start_index, 'end_index', end_index)
             request = {
                 'updateDimensionProperties': {
                     'range': {
@@ -408,7 +523,7 @@ class Sheet:
                     'fields': 'pixelSize'
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def hide_grid_lines(self, b):
             """Deposit a request to fix the hideGridlines option.
@@ -417,18 +532,8 @@ class Sheet:
             b: boolean
             returns; None
             """
-            request = {
-                'updateSheetProperties': {
-                    'properties': {
-                        'sheetId': self._sheet.sheet_id,
-                        'gridProperties': {
-                            'hideGridlines': b
-                        }
-                    },
-                    'fields': 'gridProperties.hideGridlines'
-                }
-            }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_update_sheet_properties({'gridProperties': {'hideGridlines': b}},
+                                                  'gridProperties.hideGridlines')
 
         def update_borders(self, min_row, min_col, max_row, max_col, side, style='SOLID', color=None):
             """Deposit a request to update borders.
@@ -444,27 +549,24 @@ class Sheet:
 
             returns; None
             """
-            if side not in ('top', 'bottom', 'left', 'right', 'innerHorizontal', 'innerVertical'):
-                raise ValueError("side must be a str which is one of 'top', 'bottom',"
-                                 "'left', 'right', 'innerHorizontal', 'innerVertical'")
-            if style not in ('DOTTED', 'DASHED', 'SOLID', 'SOLID_MEDIUM', 'SOLID_THICK', 'NONE', 'DOUBLE'):
-                raise ValueError("style must be a str wich is one of 'DOTTED', 'DASHED', 'SOLID',"
-                                 "'SOLID_MEDIUM', 'SOLID_THICK', 'NONE', 'DOUBLE'")
-
-            border_object = {'style': style}
-            if color is not None:
-                border_object['color'] = color
+            _validate('side', side, _BORDER_SIDES)
+            self._deposit_update_borders(grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
+                                         (side,), _border_object(style, color))
 
+        def _deposit_update_borders(self, range_json, sides, border_object):
+            """Deposit a request to update borders of the sides of range_json (GridRange json) to border_object.
+            All the sides are updated by one updateBorders request. Arguments are assumed to be validated.
+            """
+            update_borders = {'range': range_json}
+            for side in sides:
+                update_borders[side] = border_object
             request = {
-                'updateBorders': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    side: border_object
-                }
+                'updateBorders': update_borders
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_borders_around(self, min_row, min_col, max_row, max_col, style='SOLID', color=None):
-            """Deposit requests_container to update borders around.
+            """Deposit a request to update borders around.
 
             sheet_id: int
             min_row: int
@@ -476,10 +578,25 @@ class Sheet:
 
             returns; None
             """
-            self.update_borders(min_row, min_col, max_row, max_col, 'top', style, color)
-            self.update_borders(min_row, min_col, max_row, max_col, 'right', style, color)
-            self.update_borders(min_row, min_col, max_row, max_col, 'bottom', style, color)
-            self.update_borders(min_row, min_col, max_row, max_col, 'left', style, color)
+            self._deposit_update_borders(grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
+                                         ('top', 'right', 'bottom', 'left'), _border_object(style, color))
+
+        def _deposit_repeat_cell(self, min_row, min_col, max_row, max_col, cell, fields):
+            """Deposit a repeatCell request updating fields of cells in the range to cell.
+
+            min_row, min_col, max_row, max_col: int
+            cell: CellData json
+            fields: str (field mask)
+            returns: None
+            """
+            request = {
+                'repeatCell': {
+                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
+                    'cell': cell,
+                    'fields': fields
+                }
+            }
+            self._deposit(self._spreadsheet_id, request)
 
         def update_cells_default_format(self, min_row, min_col, max_row, max_col,
                                                 horizontal_alignment='LEFT', vertical_alignment='MIDDLE',
@@ -494,24 +611,19 @@ class Sheet:
 
             returns: None
             """
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'userEnteredFormat': {
-                            'horizontalAlignment': horizontal_alignment,
-                            'verticalAlignment': vertical_alignment,
-                            'textFormat': {
-                                'fontFamily': font_family,
-                                'fontSize': font_size
-                            }
-                        }
-                    },
-                    'fields': 'userEnteredFormat.horizontalAlignment, userEnteredFormat.verticalAlignment,'
-                              'userEnteredFormat.textFormat.fontFamily, userEnteredFormat.textFormat.fontSize'
+            cell = {
+                'userEnteredFormat': {
+                    'horizontalAlignment': horizontal_alignment,
+                    'verticalAlignment': vertical_alignment,
+                    'textFormat': {
+                        'fontFamily': font_family,
+                        'fontSize': font_size
+                    }
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell,
+                                      'userEnteredFormat.horizontalAlignment, userEnteredFormat.verticalAlignment,'
+                                      'userEnteredFormat.textFormat.fontFamily, userEnteredFormat.textFormat.fontSize')
 
         def update_cells_text_format(self, min_row, min_col, max_row, max_col, **text_format):
             """Deposit requests to update text formats of cells in the range.
@@ -525,26 +637,14 @@ class Sheet:
             if not text_format:
                 raise ValueError("text_format should be specified")
 
-            fields = ''
-            first_key_flag = True
-            for key in text_format:
-                if first_key_flag:
-                    fields += 'userEnteredFormat.textFormat.' + key
-                    first_key_flag = False
-                fields += ', userEnteredFormat.textFormat.' + key
+            fields = ', '.join('userEnteredFormat.textFormat.' + key for key in text_format)
 
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'userEnteredFormat': {
-                            'textFormat': text_format
-                        }
-                    },
-                    'fields': fields
+            cell = {
+                'userEnteredFormat': {
+                    'textFormat': text_format
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell, fields)
 
         def update_cell_note(self, row, col, text):
             """Deposit request to update note of the cell.
@@ -562,7 +662,7 @@ class Sheet:
                     "fields": "note"
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_cells_alignment(self, min_row, min_col, max_row, max_col,
                                            horizontal_alignment, vertical_alignment='MIDDLE'):
@@ -575,24 +675,17 @@ class Sheet:
 
             returns: None
             """
-            if horizontal_alignment not in ('LEFT', 'CENTER', 'RIGHT'):
-                raise ValueError("horizontal_alignment must be a str which is one of 'LEFT', 'CENTER', 'RIGHT'")
-            if vertical_alignment not in ('TOP', 'MIDDLE', 'BOTTOM'):
-                raise ValueError("vertical_alignment should be a str which is one of 'TOP', 'MIDDLE', 'BOTTOM'")
+            _validate('horizontal_alignment', horizontal_alignment, _HORIZONTAL_ALIGNMENTS)
+            _validate('vertical_alignment', vertical_alignment, _VERTICAL_ALIGNMENTS)
 
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'userEnteredFormat': {
-                            'horizontalAlignment': horizontal_alignment,
-                            'verticalAlignment': vertical_alignment,
-                        }
-                    },
-                    'fields': 'userEnteredFormat.horizontalAlignment, userEnteredFormat.verticalAlignment,'
+            cell = {
+                'userEnteredFormat': {
+                    'horizontalAlignment': horizontal_alignment,
+                    'verticalAlignment': vertical_alignment,
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell,
+                                      'userEnteredFormat.horizontalAlignment, userEnteredFormat.verticalAlignment,')
 
         def update_cells_background_color(self, min_row, min_col, max_row, max_col, color):
             """Deposit requests to update cells background color.
@@ -604,18 +697,12 @@ class Sheet:
 
             returns:
             """
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': color
-                        }
-                    },
-                    'fields': 'userEnteredFormat.backgroundColor'
+            cell = {
+                'userEnteredFormat': {
+                    'backgroundColor': color
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell, 'userEnteredFormat.backgroundColor')
 
         def update_cells_foreground_color(self, min_row, min_col, max_row, max_col, color):
             """Deposit requests_container to update cells foreground color.
@@ -628,20 +715,15 @@ class Sheet:
 
             returns:
             """
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'userEnteredFormat': {
-                            'textFormat': {
-                                'foregroundColor': color
-                            }
-                        }
-                    },
-                    'fields': 'userEnteredFormat.textFormat.foregroundColor'
+            cell = {
+                'userEnteredFormat': {
+                    'textFormat': {
+                        'foregroundColor': color
+                    }
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell,
+                                      'userEnteredFormat.textFormat.foregroundColor')
 
         def update_cells_values(self, row, col, values_list_list, type, **text_format):
             """Deposit requests to update cells which starts with (row, col).
@@ -658,33 +740,22 @@ class Sheet:
 
             :returns: None
             """
-            if type not in ('numberValue', 'stringValue', 'boolValue', 'formulaValue', 'errorValue'):
-                raise ValueError("type must be str which is one of: 'numberValue', 'stringValue',"
-                                 "'boolValue', 'formulaValue', 'errorValue'.")
-
-            for key in text_format:
-                if key not in (
-                'foregroundColor', 'fontFamily', 'fontSize', 'bold', 'italic', 'strikethrough', 'underline'):
-                    raise ValueError('text_format is not in a valid format.')
-
-            fields = 'userEnteredValue'
-            for key in text_format:
-                fields += ', userEnteredFormat.textFormat.' + key
-
-            rows_data = []
-            for row_values in values_list_list:
-                _row_data = []
-                for cell_value in row_values:
-                    cell_data = {
-                        'userEnteredValue': {
-                            type: cell_value
-                        },
-                        'userEnteredFormat': {
-                            'textFormat': text_format
-                        }
-                    }
-                    _row_data.append(cell_data)
-                rows_data.append({'values': _row_data})
+            _validate('type', type, _VALUE_TYPES)
+            _check_index('row', row)
+            _check_index('col', col)
+
+            if text_format.keys() - _TEXT_FORMAT_KEYS:
+                raise ValueError('text_format is not in a valid format.')
+
+            fields = ', '.join(['userEnteredValue'] + ['userEnteredFormat.textFormat.' + key for key in text_format])
+
+            # every cell shares the same userEnteredFormat json
+            user_entered_format = {
+                'textFormat': text_format
+            }
+            rows_data = [{'values': [{'userEnteredValue': {type: cell_value}, 'userEnteredFormat': user_entered_format}
+                                     for cell_value in row_values]}
+                         for row_values in values_list_list]
 
             request = {
                 'updateCells': {
@@ -698,7 +769,7 @@ class Sheet:
                 }
             }
 
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_cells_text_format_runs(self, min_row, min_col, max_row, max_col, start_index,
                                                   end_index=None,
@@ -714,10 +785,8 @@ class Sheet:
 
             returns: None
             """
-            for key in text_format:
-                if key not in (
-                'foregroundColor', 'fontFamily', 'fontSize', 'bold', 'italic', 'strikethrough', 'underline'):
-                    raise ValueError('text_format is not in a valid format.')
+            if text_format.keys() - _TEXT_FORMAT_KEYS:
+                raise ValueError('text_format is not in a valid format.')
 
             text_format_runs = [
                 {'format': text_format,
@@ -733,17 +802,10 @@ class Sheet:
                      'startIndex': end_index}
                 )
 
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'textFormatRuns': text_format_runs
-                    },
-                    'fields': 'textFormatRuns'
-                }
+            cell = {
+                'textFormatRuns': text_format_runs
             }
-
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell, 'textFormatRuns')
 
         def merge_cells(self, min_row, min_col, max_row, max_col, merge_type='MERGE_ALL'):
             """Deposit a request to merge cells.
@@ -757,16 +819,14 @@ class Sheet:
 
             returns: None
             """
-            if merge_type not in ('MERGE_ALL', 'MERGE_COLUMNS', 'MERGE_ROWS'):
-                raise ValueError("merge_type(optional) must be a str which is one of"
-                                 "'MERGE_ALL', 'MERGE_COLUMNS', 'MERGE_ROWS'")
+            _validate('merge_type', merge_type, _MERGE_TYPES)
             request = {
                 'mergeCells': {
                     'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
                     'mergeType': merge_type
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def unmerge_cells(self, min_row, min_col, max_row, max_col):
             """Deposit a request to unmerge cells.
@@ -784,7 +844,7 @@ class Sheet:
                     'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col)
                 },
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_cells_data_validation_rule(self, min_row, min_col, max_row, max_col, rule):
             """Deposit a request to update cells data validation rule.
@@ -795,16 +855,10 @@ class Sheet:
 
             returns: None
             """
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'dataValidation': rule
-                    },
-                    'fields': 'dataValidation'
-                }
+            cell = {
+                'dataValidation': rule
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell, 'dataValidation')
 
         def update_sheet_title(self, title):
             """Deposit a request to update sheet title.
@@ -812,16 +866,7 @@ class Sheet:
             title: string
             returns: None
             """
-            request = {
-                'updateSheetProperties': {
-                    'properties': {
-                        'sheetId': self._sheet.sheet_id,
-                        'title': title
-                    },
-                    'fields': 'title'
-                }
-            }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_update_sheet_properties({'title': title}, 'title')
 
         def add_conditional_format_rule(self, min_row, min_col, max_row, max_col, type, rule, index=0):
             """Deposit a request to add conditional format rule
@@ -832,8 +877,7 @@ class Sheet:
             index: int (the zero-based index where the rule should be inserted) 이 룰들에 번호가 매겨지나보다.
             returns: None
             """
-            if type not in ('booleanRule', 'gradientRule'):
-                raise ValueError("type should be a str which is one of 'booleanRule', 'gradientRule'.")
+            _validate('type', type, _CONDITIONAL_FORMAT_TYPES)
             request = {
                 'addConditionalFormatRule': {
                     'rule': {
@@ -845,7 +889,7 @@ class Sheet:
                     'index': index
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def delete_conditional_format_rule(self, index):
             """Deposit a request to delete conditional format rule indicated by zero-based index.
@@ -860,7 +904,7 @@ class Sheet:
                     'sheetId': self._sheet.sheet_id
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_cells_number_format(self, min_row, min_col, max_row, max_col, type, pattern=None):
             """Deposit a request to add conditional format rule
@@ -870,43 +914,29 @@ class Sheet:
             pattern: str (Pattern string)
             returns: None
             """
-            if type not in ('AUTOMATIC', 'TEXT', 'NUMBER', 'PERCENT', 'CURRENCY', 'DATE', 'TIME', 'DATE_TIME',
-                            'SCIENTIFIC'):
-                raise ValueError("type must be one of TEXT, NUMBER, PERCENT, CURRENCY, DATE, TIME, DATE_TIME,"
-                                 "SCIENTIFIC. But type={}".format(type))
-            if type == 'AUTOMATIC':
-                request = {
-                    'repeatCell': {
-                        'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                        'cell': {
-                            'userEnteredFormat': {
-                                'numberFormat': {}
-                            }
-
-                        },
-                        'fields': 'userEnteredFormat.numberFormat'
-                    }
+            _validate('type', type, _NUMBER_FORMAT_TYPES)
+            # empty NumberFormat json means AUTOMATIC.
+            number_format = {} if type == 'AUTOMATIC' else {'type': type, 'pattern': pattern}
+            cell = {
+                'userEnteredFormat': {
+                    'numberFormat': number_format
                 }
-            else:
-                request = {
-                    'repeatCell': {
-                        'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                        'cell': {
-                            'userEnteredFormat': {
-                                'numberFormat': {
-                                    'type': type,
-                                    'pattern': pattern
-                                }
-                            }
+            }
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell, 'userEnteredFormat.numberFormat')
 
-                        },
-                        'fields': 'userEnteredFormat.numberFormat'
-                    }
-                }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+        def _editors(self):
+            """Returns Editors json of a protected range, whose only user is google_account_email of the client.
+            Raises RuntimeError if google_account_email of the client is not set.
+            """
+            email = self._sheet.client.google_account_email
+            if not email:
+                raise RuntimeError("google_account_email of the client must be set to add sheet protection.")
+            return {
+                'users': [email],
+            }
 
         def add_sheet_protection(self):
-            assert self._sheet.client.google_account_email
+            editors = self._editors()
             request = {
                 'addProtectedRange': {
                     'protectedRange': {
@@ -918,13 +948,11 @@ class Sheet:
                             'endColumnIndex': None
                         },
                         # 이 editors 객체가 꼭 있어야한다.
-                        'editors': {
-                            'users': [self._sheet.client.google_account_email],
-                        }
+                        'editors': editors
                     }
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def add_sheet_protection_except_unprotected_range(self, min_row, min_col, max_row, max_col):
             """Deposit a request to add whole sheet protection except the specified range.
@@ -932,7 +960,7 @@ class Sheet:
             min_row, min_col, max_row, max_col: int
             returns: None
             """
-            assert self._sheet.client.google_account_email
+            editors = self._editors()
             request = {
                 'addProtectedRange': {
                     'protectedRange': {
@@ -947,13 +975,11 @@ class Sheet:
                             grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col)
                         ],
                         # 이 editors 객체가 꼭 있어야한다.
-                        'editors': {
-                            'users': [self._sheet.client.google_account_email],
-                        }
+                        'editors': editors
                     }
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def add_sheet_protection_except_unprotected_ranges(self, unprotected_ranges):
             """Deposit a request to add whole sheet protection except the specified ranges.
@@ -963,8 +989,11 @@ class Sheet:
 
             returns: None
             """
-            assert self._sheet.client.google_account_email
-            _unprotected_ranges = [grid_range(self._sheet.sheet_id, **x) for x in unprotected_ranges]
+            editors = self._editors()
+            sheet_id = self._sheet.sheet_id
+            _grid_range = grid_range  # local name, since it is called for every range
+            _unprotected_ranges = [_grid_range(sheet_id, x['min_row'], x['min_col'], x['max_row'], x['max_col'])
+                                   for x in unprotected_ranges]
             request = {
                 'addProtectedRange': {
                     'protectedRange': {
@@ -977,13 +1006,11 @@ class Sheet:
                         },
                         'unprotectedRanges': _unprotected_ranges,
                         # 이 editors 객체가 꼭 있어야한다.
-                        'editors': {
-                            'users': [self._sheet.client.google_account_email],
-                        }
+                        'editors': editors
                     }
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def delete_sheet_protection(self, protected_range_id):
             """Deposit a request to delete sheet protection whose id is protected_range_id.
@@ -996,7 +1023,7 @@ class Sheet:
                     'protectedRangeId': protected_range_id
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_cells_wrap_strategy(self, min_row, min_col, max_row, max_col, wrap_strategy):
             """
@@ -1007,18 +1034,12 @@ class Sheet:
 
             returns: None
             """
-            request = {
-                'repeatCell': {
-                    'range': grid_range(self._sheet.sheet_id, min_row, min_col, max_row, max_col),
-                    'cell': {
-                        'userEnteredFormat': {
-                            'wrapStrategy': wrap_strategy
-                        }
-                    },
-                    'fields': 'userEnteredFormat.wrapStrategy'
+            cell = {
+                'userEnteredFormat': {
+                    'wrapStrategy': wrap_strategy
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_repeat_cell(min_row, min_col, max_row, max_col, cell, 'userEnteredFormat.wrapStrategy')
 
         def delete_dimension(self, dimension, min_index, max_index):
             """Request to delete specified dimension(행 전체 또는 열 전체)
@@ -1027,6 +1048,8 @@ class Sheet:
             min_index, max_index: int
             returns None
             """
+            _validate('dimension', dimension, _DIMENSIONS)
+            _check_index_range('min_index', min_index, 'max_index', max_index)
             request = {
                 'deleteDimension': {
                     'range': {
@@ -1037,7 +1060,7 @@ class Sheet:
                     }
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
         def update_frozen_row_count(self, count):
             """Request to update frozen row count (행 고정)
@@ -1045,18 +1068,8 @@ class Sheet:
             count: int
             returns: None
             """
-            request = {
-                'updateSheetProperties': {
-                    'properties': {
-                        'sheetId': self._sheet.sheet_id,
-                        'gridProperties': {
-                            'frozenRowCount': count
-                        }
-                    },
-                    'fields': 'gridProperties.frozenRowCount'
-                }
-            }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit_update_sheet_properties({'gridProperties': {'frozenRowCount': count}},
+                                                  'gridProperties.frozenRowCount')
 
         def update_sheet_hidden(self, is_hidden):
             """Request to update sheet's hidden state.
@@ -1064,17 +1077,23 @@ class Sheet:
             is_hidden: boolean
             returns: None
             """
+            self._deposit_update_sheet_properties({'hidden': is_hidden}, 'hidden')
+
+        def _deposit_update_sheet_properties(self, properties, fields):
+            """Deposit an updateSheetProperties request updating fields of the sheet to properties.
+
+            properties: SheetProperties json without sheetId (it is added to properties)
+            fields: str (field mask)
+            returns: None
+            """
+            properties['sheetId'] = self._sheet.sheet_id
             request = {
                 'updateSheetProperties': {
-                    'properties': {
-                        'sheetId': self._sheet.sheet_id,
-                        'hidden': is_hidden
-
-                    },
-                    'fields': 'hidden'
+                    'properties': properties,
+                    'fields': fields
                 }
             }
-            self._sheet.client.requests_container.deposit(self._sheet.parent_spreadsheet.spreadsheet_id, request)
+            self._deposit(self._spreadsheet_id, request)
 
 
 
@@ -0,0 +1,301 @@
+"""
+Tests of RequestsContainer (merging, deduplication, drain and restore) and the write quota gate of Client.
+They need no network.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+from gsheetsbatch import client as client_module
+from gsheetsbatch.client import Client, RequestsContainer
+
+SPREADSHEET_ID = 'spreadsheet'
+
+
+def update_cells(row_index, rows, column_index=0, fields='userEnteredValue'):
+    return {
+        'updateCells': {
+            'rows': rows,
+            'fields': fields,
+            'start': {
+                'sheetId': 0,
+                'rowIndex': row_index,
+                'columnIndex': column_index
+            }
+        }
+    }
+
+
+def row(*values):
+    return {'values': [{'userEnteredValue': {'numberValue': value}} for value in values]}
+
+
+def repeat_cell(start_row, start_col, end_row, end_col, cell, fields):
+    return {
+        'repeatCell': {
+            'range': {
+                'sheetId': 0,
+                'startRowIndex': start_row,
+                'endRowIndex': end_row,
+                'startColumnIndex': start_col,
+                'endColumnIndex': end_col
+            },
+            'cell': cell,
+            'fields': fields
+        }
+    }
+
+
+def bold_cell(bold=True):
+    return {'userEnteredFormat': {'textFormat': {'bold': bold}}}
+
+
+def background_cell(color):
+    return {'userEnteredFormat': {'backgroundColor': color}}
+
+
+class RequestsContainerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.container = RequestsContainer()
+
+    def deposit(self, *requests):
+        for request in requests:
+            self.container.deposit(SPREADSHEET_ID, request)
+
+    def deposited(self):
+        return list(self.container.d[SPREADSHEET_ID])
+
+    def test_adjacent_update_cells_are_merged(self):
+        self.deposit(update_cells(0, [row(1)]), update_cells(1, [row(2)]), update_cells(2, [row(3), row(4)]))
+        self.assertEqual(self.deposited(), [update_cells(0, [row(1), row(2), row(3), row(4)])])
+
+    def test_non_adjacent_update_cells_are_not_merged(self):
+        requests = [
+            update_cells(0, [row(1)]),
+            update_cells(2, [row(2)]),  # a row is skipped
+            update_cells(3, [row(3)], column_index=1),  # another column
+            update_cells(4, [row(4)], column_index=1, fields='userEnteredFormat'),  # other fields
+        ]
+        self.deposit(*requests)
+        self.assertEqual(self.deposited(), requests)
+
+    def test_merging_doesnt_modify_deposited_requests(self):
+        first, second, third = update_cells(0, [row(1)]), update_cells(1, [row(2)]), update_cells(2, [row(3)])
+        self.deposit(first, second, third)
+        self.assertEqual(first, update_cells(0, [row(1)]))
+        self.assertEqual(second, update_cells(1, [row(2)]))
+        self.assertEqual(third, update_cells(2, [row(3)]))
+
+    def test_merged_update_cells_are_capped_by_rows(self):
+        with mock.patch.object(client_module, 'MERGED_UPDATE_CELLS_MAX_ROWS', 3):
+            self.deposit(*[update_cells(i, [row(i)]) for i in range(7)])
+        self.assertEqual([len(request['updateCells']['rows']) for request in self.deposited()], [3, 3, 1])
+        self.assertEqual([request['updateCells']['start']['rowIndex'] for request in self.deposited()], [0, 3, 6])
+
+    def test_merged_update_cells_are_capped_by_cells(self):
+        with mock.patch.object(client_module, 'MERGED_UPDATE_CELLS_MAX_CELLS', 5):
+            self.deposit(*[update_cells(i, [row(i, i)]) for i in range(5)])
+        self.assertEqual([len(request['updateCells']['rows']) for request in self.deposited()], [2, 2, 1])
+
+    def test_repeat_cells_over_contiguous_ranges_are_merged(self):
+        self.deposit(repeat_cell(0, 0, 1, 3, bold_cell(), 'userEnteredFormat.textFormat.bold'),
+                     repeat_cell(1, 0, 2, 3, bold_cell(), 'userEnteredFormat.textFormat.bold'),
+                     repeat_cell(0, 3, 2, 4, bold_cell(), 'userEnteredFormat.textFormat.bold'))
+        self.assertEqual(self.deposited(), [repeat_cell(0, 0, 2, 4, bold_cell(), 'userEnteredFormat.textFormat.bold')])
+
+    def test_repeat_cells_not_sharing_an_edge_are_not_merged(self):
+        requests = [
+            repeat_cell(0, 0, 1, 3, bold_cell(), 'userEnteredFormat.textFormat.bold'),
+            repeat_cell(2, 0, 3, 3, bold_cell(), 'userEnteredFormat.textFormat.bold'),  # a row is skipped
+            repeat_cell(3, 0, 4, 2, bold_cell(), 'userEnteredFormat.textFormat.bold'),  # narrower
+            repeat_cell(4, 0, 5, 2, bold_cell(False), 'userEnteredFormat.textFormat.bold'),  # another cell
+        ]
+        self.deposit(*requests)
+        self.assertEqual(self.deposited(), requests)
+
+    def test_repeat_cells_of_disjoint_fields_over_the_same_range_are_merged(self):
+        color = {'red': 1}
+        self.deposit(repeat_cell(0, 0, 1, 1, bold_cell(), 'userEnteredFormat.textFormat.bold'),
+                     repeat_cell(0, 0, 1, 1, background_cell(color), 'userEnteredFormat.backgroundColor'))
+        self.assertEqual(self.deposited(), [
+            repeat_cell(0, 0, 1, 1, {'userEnteredFormat': {'textFormat': {'bold': True}, 'backgroundColor': color}},
+                        'userEnteredFormat.textFormat.bold, userEnteredFormat.backgroundColor')
+        ])
+
+    def test_values_outside_field_mask_are_not_merged(self):
+        # italic is outside the mask of the first request, and the second one clears it.
+        cell = {'userEnteredFormat': {'textFormat': {'bold': True, 'italic': True}}}
+        self.deposit(repeat_cell(0, 0, 1, 1, cell, 'userEnteredFormat.textFormat.bold'),
+                     repeat_cell(0, 0, 1, 1, {}, 'userEnteredFormat.textFormat.italic'))
+        self.assertEqual(self.deposited(), [
+            repeat_cell(0, 0, 1, 1, bold_cell(),
+                        'userEnteredFormat.textFormat.bold, userEnteredFormat.textFormat.italic')
+        ])
+
+    def test_repeat_cells_of_overlapping_fields_are_not_merged(self):
+        requests = [
+            repeat_cell(0, 0, 1, 1, bold_cell(), 'userEnteredFormat.textFormat.bold'),
+            repeat_cell(0, 0, 1, 1, {}, 'userEnteredFormat.textFormat'),
+            repeat_cell(0, 0, 1, 1, {}, '*'),
+            repeat_cell(0, 0, 1, 1, {}, 'userEnteredFormat(backgroundColor,textFormat)'),
+        ]
+        self.deposit(*requests)
+        self.assertEqual(self.deposited(), requests)
+
+    def test_delete_protected_range_is_deduplicated(self):
+        delete_1 = {'deleteProtectedRange': {'protectedRangeId': 1}}
+        delete_2 = {'deleteProtectedRange': {'protectedRangeId': 2}}
+        self.deposit(delete_1, delete_2, delete_1)
+        self.container.deposit('another spreadsheet', delete_1)
+        self.assertEqual(self.deposited(), [delete_1, delete_2])
+        self.assertEqual(list(self.container.d['another spreadsheet']), [delete_1])
+
+        self.container.drain(SPREADSHEET_ID, 2)
+        self.deposit(delete_1)
+        self.assertEqual(self.deposited(), [delete_1])
+
+    def test_drain(self):
+        requests = [{'deleteDimension': {'range': {'startIndex': i}}} for i in range(5)]
+        self.deposit(*requests)
+        self.assertEqual(self.container.drain(SPREADSHEET_ID, 2), requests[:2])
+        self.assertEqual(self.container.drain(SPREADSHEET_ID, 10), requests[2:])
+        self.assertEqual(self.container.drain(SPREADSHEET_ID, 10), [])
+        self.assertNotIn(SPREADSHEET_ID, self.container.d)
+
+    def test_restore_keeps_order(self):
+        requests = [{'deleteDimension': {'range': {'startIndex': i}}} for i in range(5)]
+        self.deposit(*requests)
+        drained = self.container.drain(SPREADSHEET_ID, 2)
+        self.container.restore(SPREADSHEET_ID, drained)
+        self.assertEqual(self.deposited(), requests)
+
+    def test_restore_records_deleted_protected_ranges_again(self):
+        delete_1 = {'deleteProtectedRange': {'protectedRangeId': 1}}
+        self.deposit(delete_1)
+        self.container.restore(SPREADSHEET_ID, self.container.drain(SPREADSHEET_ID, 1))
+        self.deposit(delete_1)
+        self.assertEqual(self.deposited(), [delete_1])
+
+
+class ExecuteTest(unittest.TestCase):
+
+    def test_failed_chunk_is_executed_first_next_time(self):
+        client = Client()
+        client._service = object()
+        sent = []
+
+        def send_batch(spreadsheet_id, requests):
+            if len(sent) == 1 and not send_batch.failed:
+                send_batch.failed = True
+                raise RuntimeError('batchUpdate failed')
+            sent.append(requests)
+        send_batch.failed = False
+
+        requests = [{'deleteDimension': {'range': {'startIndex': i}}} for i in range(5)]
+        for request in requests:
+            client.requests_container.deposit(SPREADSHEET_ID, request)
+        with mock.patch.object(client_module, 'BATCH_UPDATE_CHUNK_SIZE', 2), \
+                mock.patch.object(client, '_send_batch', send_batch):
+            with self.assertRaises(RuntimeError):
+                client.execute_deposited_requests_of_the_spreadsheet(SPREADSHEET_ID)
+            self.assertEqual(list(client.requests_container.d[SPREADSHEET_ID]), requests[2:])
+            client.execute_deposited_requests_of_the_spreadsheet(SPREADSHEET_ID)
+        self.assertEqual(sent, [requests[:2], requests[2:4], requests[4:]])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakeCondition(threading.Condition):
+    """Condition whose wait(timeout) advances the fake clock instead of sleeping."""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+        self.waits = []
+
+    def wait(self, timeout=None):
+        if timeout is None:
+            raise AssertionError('waiting for a write in flight would block forever in a single thread')
+        self.waits.append(timeout)
+        self.clock.now += timeout
+        return False
+
+
+class WriteQuotaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patchers = [
+            mock.patch.object(client_module, 'WRITE_QUOTA_REQUESTS', 3),
+            mock.patch.object(client_module, 'WRITE_QUOTA_SECONDS', 10),
+            mock.patch.object(client_module.time, 'monotonic', self.clock.monotonic),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = Client()
+        self.condition = self.client._write_quota_condition = FakeCondition(self.clock)
+
+    def write(self, duration=0):
+        self.client.test_for_write_quota()
+        self.clock.now += duration
+        self.client._register_write()
+
+    def test_writes_under_quota_dont_wait(self):
+        for _ in range(3):
+            self.write()
+        self.assertEqual(self.condition.waits, [])
+
+    def test_write_over_quota_waits_until_the_oldest_leaves_the_window(self):
+        self.write()
+        self.clock.now += 2
+        self.write()
+        self.write()
+        self.clock.now += 3
+        self.write()
+        # the oldest write was registered at 1000, so the fourth one waits until 1010.
+        self.assertEqual(self.condition.waits, [5])
+        self.assertEqual(self.client._write_times[-1], 1010)
+
+    def test_writes_out_of_the_window_dont_wait(self):
+        for _ in range(3):
+            self.write()
+        self.clock.now += 10
+        for _ in range(3):
+            self.write()
+        self.assertEqual(self.condition.waits, [])
+
+    def test_write_is_registered_after_execution(self):
+        for _ in range(3):
+            self.write(duration=4)
+        # the writes are registered at 1004, 1008 and 1012, so the next one waits until 1014.
+        self.write()
+        self.assertEqual(self.condition.waits, [2])
+
+    def test_writes_in_flight_count(self):
+        for _ in range(3):
+            self.client.test_for_write_quota()
+        self.assertEqual(self.client._writes_in_flight, 3)
+        with self.assertRaises(AssertionError):
+            # all the 3 writes in the window are in flight, so the next one waits for one of them to be registered.
+            self.client.test_for_write_quota()
+
+    def test_write_waits_for_the_oldest_registered_write_when_others_are_in_flight(self):
+        self.write()
+        self.clock.now += 4
+        self.client.test_for_write_quota()
+        self.client.test_for_write_quota()
+        self.client.test_for_write_quota()
+        self.assertEqual(self.condition.waits, [6])
+
+
+if __name__ == '__main__':
+    unittest.main()